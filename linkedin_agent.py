@@ -1,230 +1,391 @@
 import re
 import json
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import functools
+import itertools
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, fields
 from enum import Enum
 
-class OpportunityType(Enum):
+import ahocorasick
+
+# Patterns are compiled once at import rather than on every call
+
+# URL characters are letters, digits, '!' and the ASCII range '$'..'_'
+# (most punctuation), matched as one character class
+_URL_RE = re.compile(r'https?://[A-Za-z0-9!$-_]+')
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
+# Technology mentions, matched as literals against lowercased text and
+# reported with their canonical spelling
+_TECH_CANONICAL = {
+    'python': 'Python', 'java': 'Java', 'javascript': 'JavaScript', 'react': 'React',
+    'angular': 'Angular', 'vue': 'Vue', 'node.js': 'Node.js', 'nodejs': 'Node.js',
+    'django': 'Django', 'flask': 'Flask', 'spring': 'Spring',
+    'sql': 'SQL', 'mysql': 'MySQL', 'postgresql': 'PostgreSQL', 'mongodb': 'MongoDB',
+    'oracle': 'Oracle', 'elasticsearch': 'Elasticsearch',
+    'aws': 'AWS', 'azure': 'Azure', 'gcp': 'GCP', 'google cloud': 'Google Cloud', 'cloud': 'Cloud',
+    'tableau': 'Tableau', 'power bi': 'Power BI', 'looker': 'Looker', 'qlik': 'Qlik', 'grafana': 'Grafana',
+    'api': 'API', 'rest': 'REST', 'graphql': 'GraphQL', 'microservices': 'Microservices',
+    'mobile': 'Mobile', 'ios': 'iOS', 'android': 'Android', 'flutter': 'Flutter',
+    'react native': 'React Native'
+}
+
+def _build_tech_automaton() -> ahocorasick.Automaton:
+    """Build the automaton used to find technology mentions in one pass"""
+    automaton = ahocorasick.Automaton()
+    for token, canonical in _TECH_CANONICAL.items():
+        automaton.add_word(token, canonical)
+    automaton.make_automaton()
+    return automaton
+
+_TECH_AUTOMATON = _build_tech_automaton()
+
+# Number of distinct post texts whose analysis is cached per agent
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Budget and timeline mentions; like the technology tokens these run on
+# lowercased text, so they are compiled without re.IGNORECASE
+_BUDGET_RE = re.compile(r'\$[\d,]+(?:\.\d{2})?|\d+k?\s*(?:budget|dollar|usd)')
+_TIMELINE_RE = re.compile(r'\d+\s*(?:days?|weeks?|months?|hours?)')
+
+# The str mixin gives members str's C-level hash and equality, which keeps
+# dict lookups keyed by these enums cheap; .value is still the string name.
+# Members therefore equal their values (UrgencyLevel.LOW == 'low'). Ordering
+# would be alphabetical rather than by urgency, so it is disabled.
+class _StrEnum(str, Enum):
+    def __lt__(self, other):
+        raise TypeError(f"{type(self).__name__} members are not ordered")
+    
+    __le__ = __gt__ = __ge__ = __lt__
+
+class OpportunityType(_StrEnum):
     DATA_INTEGRATION = "data_integration"
     DATA_VISUALIZATION = "data_visualization"
     WEB_DEVELOPMENT = "web_development"
     APP_DEVELOPMENT = "app_development"
     MIXED = "mixed"
 
-class UrgencyLevel(Enum):
+class UrgencyLevel(_StrEnum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     URGENT = "urgent"
 
-@dataclass
+# Immutable so cached results can be shared safely. __slots__ is declared by
+# hand because dataclass(slots=True) needs Python 3.10.
+@dataclass(frozen=True)
 class OpportunityScore:
+    __slots__ = ('opportunity_type', 'confidence_score', 'urgency_level',
+                 'key_indicators', 'extracted_requirements')
+    
     opportunity_type: OpportunityType
     confidence_score: float  # 0-1
     urgency_level: UrgencyLevel
-    key_indicators: List[str]
-    extracted_requirements: List[str]
+    key_indicators: Tuple[str, ...]
+    extracted_requirements: Tuple[str, ...]
+    
+    # Frozen instances reject the setattr calls that pickle and copy use to
+    # restore slots, so state is restored the way dataclass(slots=True) does
+    def __getstate__(self):
+        return [getattr(self, field.name) for field in fields(self)]
+    
+    def __setstate__(self, state):
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+
+# Result for posts that are not seeking help; shared since results are immutable
+_DEFAULT_SCORE = OpportunityScore(
+    opportunity_type=OpportunityType.DATA_INTEGRATION,  # Default
+    confidence_score=0.0,
+    urgency_level=UrgencyLevel.LOW,
+    key_indicators=(),
+    extracted_requirements=()
+)
 
 class LinkedInOpportunityAgent:
     def __init__(self):
         # Keywords for different opportunity types
         self.keywords = {
             OpportunityType.DATA_INTEGRATION: {
-                'primary': [
+                'primary': (
                     'data integration', 'data pipeline', 'etl', 'data migration',
                     'api integration', 'database sync', 'data warehousing',
                     'data consolidation', 'system integration', 'data flow'
-                ],
-                'secondary': [
+                ),
+                'secondary': (
                     'connect systems', 'merge data', 'automate data',
                     'real-time data', 'data sync', 'import data', 'export data'
-                ]
+                )
             },
             OpportunityType.DATA_VISUALIZATION: {
-                'primary': [
+                'primary': (
                     'data visualization', 'dashboard', 'reporting', 'analytics',
                     'charts', 'graphs', 'business intelligence', 'bi tool',
                     'data analysis', 'metrics', 'kpi dashboard'
-                ],
-                'secondary': [
+                ),
+                'secondary': (
                     'visualize data', 'show data', 'data insights',
                     'performance tracking', 'report automation', 'tableau',
                     'power bi', 'looker', 'data studio'
-                ]
+                )
             },
             OpportunityType.WEB_DEVELOPMENT: {
-                'primary': [
+                'primary': (
                     'website', 'web development', 'web app', 'web application',
                     'frontend', 'backend', 'full stack', 'responsive design',
                     'web portal', 'landing page', 'e-commerce'
-                ],
-                'secondary': [
+                ),
+                'secondary': (
                     'build website', 'create site', 'web solution',
                     'online presence', 'web platform', 'cms', 'wordpress',
                     'react', 'angular', 'vue', 'django', 'flask'
-                ]
+                )
             },
             OpportunityType.APP_DEVELOPMENT: {
-                'primary': [
+                'primary': (
                     'mobile app', 'app development', 'ios app', 'android app',
                     'application development', 'native app', 'cross platform',
                     'flutter', 'react native', 'swift', 'kotlin'
-                ],
-                'secondary': [
+                ),
+                'secondary': (
                     'build app', 'create application', 'mobile solution',
                     'app store', 'play store', 'mobile platform'
-                ]
+                )
             }
         }
         
         # Help-seeking indicators
-        self.help_indicators = [
+        self.help_indicators = (
             'looking for', 'need help', 'seeking', 'require', 'want to hire',
             'need assistance', 'help needed', 'recommendations for',
             'anyone know', 'suggestions for', 'advice on', 'expertise in',
             'consultant', 'freelancer', 'agency', 'developer', 'specialist',
             'outsource', 'contract', 'project', 'budget for', 'quote for'
-        ]
+        )
+        
+        # Posts shorter than the shortest help indicator are skipped early
+        self._min_help_len = min(len(indicator) for indicator in self.help_indicators)
         
         # Urgency indicators
         self.urgency_indicators = {
-            UrgencyLevel.URGENT: ['urgent', 'asap', 'immediately', 'rush', 'emergency'],
-            UrgencyLevel.HIGH: ['soon', 'quickly', 'fast', 'priority', 'deadline'],
-            UrgencyLevel.MEDIUM: ['next month', 'few weeks', 'planning', 'upcoming'],
-            UrgencyLevel.LOW: ['future', 'eventually', 'considering', 'thinking about']
+            UrgencyLevel.URGENT: ('urgent', 'asap', 'immediately', 'rush', 'emergency'),
+            UrgencyLevel.HIGH: ('soon', 'quickly', 'fast', 'priority', 'deadline'),
+            UrgencyLevel.MEDIUM: ('next month', 'few weeks', 'planning', 'upcoming'),
+            UrgencyLevel.LOW: ('future', 'eventually', 'considering', 'thinking about')
+        }
+        
+        # Highest weighted keyword score per opportunity type; a type with no
+        # keywords can never score, so 1 stands in for 0 to avoid dividing by it
+        self._max_possible = {
+            opp_type: max((len(keywords['primary']) * 2) + len(keywords['secondary']), 1)
+            for opp_type, keywords in self.keywords.items()
+        }
+        
+        # Single automaton over every indicator and keyword so a post is
+        # scanned once. Each hit is tagged (kind, group, word): kind is 'help',
+        # 'primary', 'secondary' or 'urgency', and group is None for help
+        # indicators, the OpportunityType for keywords and the UrgencyLevel
+        # for urgency indicators
+        self._automaton = ahocorasick.Automaton()
+        for indicator in self.help_indicators:
+            self._automaton.add_word(indicator, ('help', None, indicator))
+        for opp_type, keywords in self.keywords.items():
+            for kind in ('primary', 'secondary'):
+                for keyword in keywords[kind]:
+                    self._automaton.add_word(keyword, (kind, opp_type, keyword))
+        for urgency_level, indicators in self.urgency_indicators.items():
+            for indicator in indicators:
+                self._automaton.add_word(indicator, ('urgency', urgency_level, indicator))
+        self._automaton.make_automaton()
+        
+        # Suggested approaches for each opportunity type
+        self.response_approaches = {
+            OpportunityType.DATA_INTEGRATION: (
+                "Highlight experience with ETL processes and data pipelines",
+                "Mention specific integration tools (Zapier, MuleSoft, custom APIs)",
+                "Showcase data warehousing and real-time processing capabilities"
+            ),
+            OpportunityType.DATA_VISUALIZATION: (
+                "Share portfolio of dashboard examples",
+                "Mention expertise in Tableau, Power BI, or custom solutions",
+                "Highlight ability to translate business needs into visual insights"
+            ),
+            OpportunityType.WEB_DEVELOPMENT: (
+                "Showcase relevant web development portfolio",
+                "Mention technology stack expertise (React, Django, etc.)",
+                "Emphasize responsive design and user experience"
+            ),
+            OpportunityType.APP_DEVELOPMENT: (
+                "Share mobile app portfolio and app store links",
+                "Mention cross-platform vs native development capabilities",
+                "Highlight user-centric design approach"
+            ),
+            OpportunityType.MIXED: (
+                "Emphasize full-stack capabilities across multiple domains",
+                "Mention integrated solutions experience",
+                "Highlight project management for complex requirements"
+            )
         }
+        
+        # Urgency levels that call for quick-turnaround suggestions
+        self.fast_turnaround_levels = frozenset((UrgencyLevel.HIGH, UrgencyLevel.URGENT))
+        
+        # Analysis is pure over the post text, so repeated posts (retries,
+        # duplicates across pages) are served from a per-agent cache
+        self._analyze_cached = functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)(self._analyze_uncached)
 
     def preprocess_text(self, text: str) -> str:
         """Clean and normalize text for analysis"""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Convert to lowercase and collapse whitespace
+        text = ' '.join(text.lower().split())
         
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = _URL_RE.sub('', text)
         
-        # Remove hashtags for cleaner analysis (but keep the text)
-        text = re.sub(r'#(\w+)', r'\1', text)
+        # Remove hashtags for cleaner analysis (but keep the text); this runs
+        # after URL removal, which can leave a '#' next to new text
+        return _HASHTAG_RE.sub(r'\1', text).strip()
+
+    def _scan(self, text: str) -> Dict[tuple, Set[str]]:
+        """Find every indicator and keyword in one pass, grouped by (kind, group)"""
+        matches = {}
+        
+        for _, (kind, group, word) in self._automaton.iter(text):
+            matches.setdefault((kind, group), set()).add(word)
         
-        return text.strip()
+        return matches
 
-    def detect_help_seeking(self, text: str) -> Tuple[bool, List[str]]:
+    def detect_help_seeking(self, text: str, matches: Optional[Dict[tuple, Set[str]]] = None) -> Tuple[bool, List[str]]:
         """Detect if the post is seeking help/services"""
-        found_indicators = []
+        if matches is None:
+            matches = self._scan(text)
         
-        for indicator in self.help_indicators:
-            if indicator in text:
-                found_indicators.append(indicator)
+        found = matches.get(('help', None), set())
+        found_indicators = [indicator for indicator in self.help_indicators if indicator in found]
         
         return len(found_indicators) > 0, found_indicators
 
-    def calculate_opportunity_scores(self, text: str) -> Dict[OpportunityType, float]:
+    def calculate_opportunity_scores(self, text: str, matches: Optional[Dict[tuple, Set[str]]] = None) -> Dict[OpportunityType, float]:
         """Calculate confidence scores for each opportunity type"""
+        if matches is None:
+            matches = self._scan(text)
+        
         scores = {}
         
-        for opp_type, keywords in self.keywords.items():
-            primary_matches = sum(1 for keyword in keywords['primary'] if keyword in text)
-            secondary_matches = sum(1 for keyword in keywords['secondary'] if keyword in text)
+        for opp_type, max_possible in self._max_possible.items():
+            primary_matches = len(matches.get(('primary', opp_type), ()))
+            secondary_matches = len(matches.get(('secondary', opp_type), ()))
             
             # Weight primary keywords more heavily
             total_score = (primary_matches * 2) + secondary_matches
-            max_possible = (len(keywords['primary']) * 2) + len(keywords['secondary'])
             
-            scores[opp_type] = min(total_score / max_possible, 1.0) if max_possible > 0 else 0.0
+            scores[opp_type] = min(total_score / max_possible, 1.0)
         
         return scores
 
-    def detect_urgency(self, text: str) -> UrgencyLevel:
+    def detect_urgency(self, text: str, matches: Optional[Dict[tuple, Set[str]]] = None) -> UrgencyLevel:
         """Determine urgency level based on text indicators"""
-        for urgency_level, indicators in self.urgency_indicators.items():
-            for indicator in indicators:
-                if indicator in text:
-                    return urgency_level
+        if matches is None:
+            matches = self._scan(text)
+        
+        # Levels are checked in declaration order, most urgent first
+        for urgency_level in self.urgency_indicators:
+            if ('urgency', urgency_level) in matches:
+                return urgency_level
         
         return UrgencyLevel.MEDIUM  # Default
 
-    def extract_requirements(self, text: str) -> List[str]:
-        """Extract specific requirements mentioned in the post"""
-        requirements = []
-        
-        # Look for technology mentions
-        tech_patterns = [
-            r'(python|java|javascript|react|angular|vue|node\.?js|django|flask|spring)',
-            r'(sql|mysql|postgresql|mongodb|oracle|elasticsearch)',
-            r'(aws|azure|gcp|google cloud|cloud)',
-            r'(tableau|power bi|looker|qlik|grafana)',
-            r'(api|rest|graphql|microservices)',
-            r'(mobile|ios|android|flutter|react native)'
-        ]
-        
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            requirements.extend([match.title() for match in matches])
+    def extract_requirements(self, text: str) -> Tuple[str, ...]:
+        """Extract specific requirements mentioned in the post (expects preprocessed text)"""
+        # Look for technology mentions in order of first appearance, preferring
+        # the longest token at each position (e.g. 'javascript' over 'java')
+        requirements = list(dict.fromkeys(canonical for _, canonical in _TECH_AUTOMATON.iter_long(text)))
         
         # Look for budget mentions
-        budget_pattern = r'\$[\d,]+(?:\.\d{2})?|\d+k?\s*(?:budget|dollar|usd)'
-        budget_matches = re.findall(budget_pattern, text, re.IGNORECASE)
+        budget_matches = _BUDGET_RE.findall(text)
         if budget_matches:
             requirements.append(f"Budget mentioned: {', '.join(budget_matches)}")
         
         # Look for timeline mentions
-        timeline_pattern = r'\d+\s*(?:days?|weeks?|months?|hours?)'
-        timeline_matches = re.findall(timeline_pattern, text, re.IGNORECASE)
+        timeline_matches = _TIMELINE_RE.findall(text)
         if timeline_matches:
             requirements.append(f"Timeline: {', '.join(timeline_matches)}")
         
-        return list(set(requirements))  # Remove duplicates
+        return tuple(requirements)
 
     def analyze_post(self, post_text: str) -> OpportunityScore:
         """Main method to analyze a LinkedIn post for opportunities"""
+        return self._analyze_cached(post_text)
+
+    def analyze_posts(self, post_texts: Iterable[str]) -> List[OpportunityScore]:
+        """Analyze a batch of LinkedIn posts, in order"""
+        analyze = self._analyze_cached
+        return [analyze(post_text) for post_text in post_texts]
+
+    def _analyze_uncached(self, post_text: str) -> OpportunityScore:
+        """Analyze a post without consulting the result cache"""
         
         # Preprocess text
         cleaned_text = self.preprocess_text(post_text)
         
+        # Too short to contain any help indicator, so it can't be seeking help
+        if len(cleaned_text) < self._min_help_len:
+            return _DEFAULT_SCORE
+        
+        # Scan once for all indicators and keywords
+        matches = self._scan(cleaned_text)
+        
         # Check if post is seeking help
-        is_seeking_help, help_indicators = self.detect_help_seeking(cleaned_text)
+        is_seeking_help, help_indicators = self.detect_help_seeking(cleaned_text, matches)
         
         if not is_seeking_help:
-            return OpportunityScore(
-                opportunity_type=OpportunityType.DATA_INTEGRATION,  # Default
-                confidence_score=0.0,
-                urgency_level=UrgencyLevel.LOW,
-                key_indicators=[],
-                extracted_requirements=[]
-            )
+            return _DEFAULT_SCORE
         
         # Calculate opportunity scores
-        opportunity_scores = self.calculate_opportunity_scores(cleaned_text)
-        
-        # Find the highest scoring opportunity type
-        best_opportunity = max(opportunity_scores.items(), key=lambda x: x[1])
-        opportunity_type, confidence_score = best_opportunity
+        opportunity_scores = self.calculate_opportunity_scores(cleaned_text, matches)
+        
+        # Find the highest scoring opportunity type, counting high scores in
+        # the same pass (the first type wins ties, as with max())
+        opportunity_type, confidence_score = None, -1.0
+        high_scores = 0
+        for opp_type, score in opportunity_scores.items():
+            if score > confidence_score:
+                opportunity_type, confidence_score = opp_type, score
+            if score > 0.3:
+                high_scores += 1
         
         # Check if it's a mixed opportunity (multiple high scores)
-        high_scores = [opp for opp, score in opportunity_scores.items() if score > 0.3]
-        if len(high_scores) > 1:
+        if high_scores > 1:
             opportunity_type = OpportunityType.MIXED
         
         # Detect urgency
-        urgency = self.detect_urgency(cleaned_text)
+        urgency = self.detect_urgency(cleaned_text, matches)
         
         # Extract requirements
         requirements = self.extract_requirements(cleaned_text)
         
-        # Compile key indicators
-        key_indicators = help_indicators.copy()
-        for opp_type, keywords in self.keywords.items():
-            for keyword in keywords['primary'] + keywords['secondary']:
-                if keyword in cleaned_text:
-                    key_indicators.append(keyword)
+        # Compile key indicators: help indicators first, then matched
+        # keywords in declaration order, stopping once 10 unique entries
+        # are collected
+        matched_keywords = (
+            keyword
+            for opp_type, keywords in self.keywords.items()
+            for kind in ('primary', 'secondary')
+            if (kind, opp_type) in matches
+            for keyword in keywords[kind]
+            if keyword in matches[(kind, opp_type)]
+        )
+        key_indicators = {}
+        for indicator in itertools.chain(help_indicators, matched_keywords):
+            key_indicators[indicator] = None
+            if len(key_indicators) == 10:
+                break
         
         return OpportunityScore(
             opportunity_type=opportunity_type,
             confidence_score=confidence_score,
             urgency_level=urgency,
-            key_indicators=list(set(key_indicators))[:10],  # Limit to top 10
+            key_indicators=tuple(key_indicators),
             extracted_requirements=requirements
         )
 
@@ -235,38 +396,10 @@ class LinkedInOpportunityAgent:
         if opportunity.confidence_score < 0.2:
             return ["Low confidence opportunity - may not be relevant"]
         
-        base_approaches = {
-            OpportunityType.DATA_INTEGRATION: [
-                "Highlight experience with ETL processes and data pipelines",
-                "Mention specific integration tools (Zapier, MuleSoft, custom APIs)",
-                "Showcase data warehousing and real-time processing capabilities"
-            ],
-            OpportunityType.DATA_VISUALIZATION: [
-                "Share portfolio of dashboard examples",
-                "Mention expertise in Tableau, Power BI, or custom solutions",
-                "Highlight ability to translate business needs into visual insights"
-            ],
-            OpportunityType.WEB_DEVELOPMENT: [
-                "Showcase relevant web development portfolio",
-                "Mention technology stack expertise (React, Django, etc.)",
-                "Emphasize responsive design and user experience"
-            ],
-            OpportunityType.APP_DEVELOPMENT: [
-                "Share mobile app portfolio and app store links",
-                "Mention cross-platform vs native development capabilities",
-                "Highlight user-centric design approach"
-            ],
-            OpportunityType.MIXED: [
-                "Emphasize full-stack capabilities across multiple domains",
-                "Mention integrated solutions experience",
-                "Highlight project management for complex requirements"
-            ]
-        }
-        
-        suggestions.extend(base_approaches.get(opportunity.opportunity_type, []))
+        suggestions.extend(self.response_approaches.get(opportunity.opportunity_type, ()))
         
         # Add urgency-specific suggestions
-        if opportunity.urgency_level in [UrgencyLevel.HIGH, UrgencyLevel.URGENT]:
+        if opportunity.urgency_level in self.fast_turnaround_levels:
             suggestions.append("Emphasize quick turnaround and availability")
             suggestions.append("Mention agile development approach")
         
@@ -292,9 +425,10 @@ def main():
     print("LinkedIn Opportunity Detection Results:")
     print("=" * 50)
     
-    for i, post in enumerate(test_posts, 1):
+    results = agent.analyze_posts(test_posts)
+    
+    for i, (post, result) in enumerate(zip(test_posts, results), 1):
         print(f"\nPost {i}: {post[:100]}...")
-        result = agent.analyze_post(post)
         
         print(f"Opportunity Type: {result.opportunity_type.value}")
         print(f"Confidence Score: {result.confidence_score:.2f}")
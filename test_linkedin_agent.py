@@ -0,0 +1,78 @@
+import copy
+import pickle
+import unittest
+
+from linkedin_agent import LinkedInOpportunityAgent, UrgencyLevel, _DEFAULT_SCORE
+
+
+class PreprocessTextTest(unittest.TestCase):
+    def setUp(self):
+        self.agent = LinkedInOpportunityAgent()
+
+    def test_urls_removed_before_hashtags_are_unwrapped(self):
+        # Expected values match the original whitespace/URL/hashtag passes
+        cases = {
+            'Check https://example.com/a?b=1 and #DataViz  today': 'check  and dataviz today',
+            '#hiringhttps://lnkd.in/etl-dashboard-project': 'hiring',
+            'see #https://evil.com/path now': 'see # now',
+            '#http://a.b': '#',
+            '#https://xé': 'é',
+            '##https://': '#https://',
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.agent.preprocess_text(text), expected)
+
+    def test_url_slug_does_not_trigger_help_seeking(self):
+        result = self.agent.analyze_post('#hiringhttps://lnkd.in/etl-dashboard-project')
+        self.assertEqual(result.confidence_score, 0.0)
+        self.assertEqual(result.key_indicators, ())
+
+
+
+class ExtractRequirementsTest(unittest.TestCase):
+    def test_requirements_keep_order_of_first_mention(self):
+        agent = LinkedInOpportunityAgent()
+        text = agent.preprocess_text(
+            "Need a React Native and Python developer, then Python again for AWS. Budget $5k, 3 weeks."
+        )
+        self.assertEqual(
+            agent.extract_requirements(text),
+            ('React Native', 'Python', 'AWS', 'Budget mentioned: $5', 'Timeline: 3 weeks')
+        )
+
+
+class OpportunityScoreTest(unittest.TestCase):
+    def setUp(self):
+        self.result = LinkedInOpportunityAgent().analyze_post(
+            "Looking for a developer to build a dashboard with Tableau. Budget $5k, 3 weeks."
+        )
+
+    def test_pickle_round_trip(self):
+        for score in (self.result, _DEFAULT_SCORE):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(score=score, protocol=protocol):
+                    self.assertEqual(pickle.loads(pickle.dumps(score, protocol)), score)
+
+    def test_copy_and_deepcopy(self):
+        self.assertEqual(copy.copy(self.result), self.result)
+        self.assertEqual(copy.deepcopy(self.result), self.result)
+
+
+
+class EnumTest(unittest.TestCase):
+    def test_members_compare_equal_to_values(self):
+        self.assertEqual(UrgencyLevel.LOW, 'low')
+        self.assertEqual(UrgencyLevel.LOW.value, 'low')
+
+    def test_ordering_is_not_supported(self):
+        with self.assertRaises(TypeError):
+            UrgencyLevel.HIGH < UrgencyLevel.LOW
+        with self.assertRaises(TypeError):
+            UrgencyLevel.HIGH >= 'high'
+        with self.assertRaises(TypeError):
+            'z' > UrgencyLevel.HIGH
+
+
+if __name__ == '__main__':
+    unittest.main()